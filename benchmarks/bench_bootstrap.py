@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Bootstrap Download Benchmarks
+
+Times full bootstrap.py runs against a local HTTP stand-in for GitHub, so
+changes to the download path can be measured without network access.
+
+The stand-in serves a copy of the .claude tree (plus VERSION, the manifest
+and a release archive) with configurable per-request latency, bandwidth
+cap and error injection, and supports ETag/If-None-Match and Range
+requests like raw.githubusercontent.com.
+
+Each scenario is run in both per-file and --bulk mode:
+    cold        empty install directory and empty download cache
+    warm        re-run over an intact install
+    cache       empty install directory, download cache already populated
+    corrupt     intact install with one file modified and one deleted
+    concurrent  several bootstrap.py processes at once sharing one cache
+    unverified  (bulk only) cold install from a source without a manifest
+
+Usage:
+    python3 benchmarks/bench_bootstrap.py
+    python3 benchmarks/bench_bootstrap.py --latency 80 --bandwidth 512
+    python3 benchmarks/bench_bootstrap.py --save baseline.json
+    python3 benchmarks/bench_bootstrap.py --compare baseline.json
+"""
+
+import sys
+import io
+
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
+import random
+import shutil
+import statistics
+import subprocess
+import tarfile
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import bootstrap  # noqa: E402
+
+SCENARIOS = ("cold", "warm", "cache", "corrupt", "concurrent", "unverified")
+BULK_ONLY_SCENARIOS = ("unverified",)
+MODES = ("files", "bulk")
+ARCHIVE_NAME = "archive.tar.gz"
+UNVERIFIED_DIR = "unverified"  # Site subdirectory published without a manifest
+DEFAULT_CONCURRENCY = 4
+DEFAULT_THRESHOLD = 0.25
+MIN_DELTA = 0.005  # Ignore timing differences below 5 ms as noise
+
+WORDS = (
+    "plan task phase commit review research context skill hook workflow "
+    "install version manifest cache archive target source module script"
+).split()
+
+
+class ShapedHTTPServer(ThreadingHTTPServer):
+    """HTTP server for a site directory with latency, bandwidth and error shaping."""
+
+    daemon_threads = True
+
+    def __init__(self, root: Path, latency: float, bandwidth: int, error_rate: float, seed: int):
+        super().__init__(("127.0.0.1", 0), ShapedRequestHandler)
+        self.root = root.resolve()
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.stats = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset_stats(self):
+        """Zero the request counters."""
+        with self._lock:
+            self.stats = {
+                "requests": 0,
+                "bytes": 0,
+                "not_modified": 0,
+                "partial": 0,
+                "injected_errors": 0,
+            }
+
+    def record(self, **counts):
+        """Add to the request counters."""
+        with self._lock:
+            for name, value in counts.items():
+                self.stats[name] += value
+
+    def snapshot(self):
+        """Return a copy of the request counters."""
+        with self._lock:
+            return dict(self.stats)
+
+    def choose_error(self):
+        """
+        Decide whether to inject a failure into the next response.
+
+        Returns:
+            str or None: "status" for a 503, "drop" for a truncated body, or None
+        """
+        with self._lock:
+            if self.error_rate <= 0 or self.random.random() >= self.error_rate:
+                return None
+            return self.random.choice(("status", "drop"))
+
+
+class ShapedRequestHandler(BaseHTTPRequestHandler):
+    """Serves files from the server root the way raw.githubusercontent.com does."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.record(requests=1)
+        if server.latency:
+            time.sleep(server.latency)
+
+        path = (server.root / unquote(urlsplit(self.path).path).lstrip("/")).resolve()
+        if server.root not in path.parents or not path.is_file():
+            self.send_body(404, b"Not Found")
+            return
+
+        error = server.choose_error()
+        if error == "status":
+            server.record(injected_errors=1)
+            self.send_body(503, b"Service Unavailable")
+            return
+
+        data = path.read_bytes()
+        etag = '"%s"' % hashlib.sha256(data).hexdigest()[:20]
+        if self.headers.get("If-None-Match") == etag:
+            server.record(not_modified=1)
+            self.send_body(304, b"", {"ETag": etag})
+            return
+
+        status = 200
+        headers = {"ETag": etag}
+        range_header = self.headers.get("Range", "")
+        if_range = self.headers.get("If-Range")
+        if range_header.startswith("bytes=") and if_range in (None, etag):
+            start = int(range_header[len("bytes="):].split("-")[0] or 0)
+            if start >= len(data):
+                self.send_body(416, b"", {"Content-Range": f"bytes */{len(data)}"})
+                return
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{len(data) - 1}/{len(data)}"
+            server.record(partial=1)
+            data = data[start:]
+        elif (path.suffix != ".gz"
+                and "gzip" in self.headers.get("Accept-Encoding", "")):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+
+        if error == "drop":
+            server.record(injected_errors=1)
+            self.send_body(status, data, headers, truncate=True)
+        else:
+            self.send_body(status, data, headers)
+
+    def send_body(self, status: int, body: bytes, headers=None, truncate: bool = False):
+        """Send a response, pacing the body to the configured bandwidth."""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        if truncate:
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        bandwidth = self.server.bandwidth
+        chunk_size = max(1024, bandwidth // 50) if bandwidth else len(body) or 1
+        for offset in range(0, len(body), chunk_size):
+            chunk = body[offset:offset + chunk_size]
+            self.wfile.write(chunk)
+            self.server.record(bytes=len(chunk))
+            if bandwidth:
+                time.sleep(len(chunk) / bandwidth)
+
+
+def synthetic_text(rng, size: int) -> str:
+    """Return roughly size bytes of markdown-like text."""
+    lines = []
+    total = 0
+    while total < size:
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def write_synthetic_tree(claude_dir: Path):
+    """
+    Generate a stand-in .claude tree for checkouts that do not include one.
+
+    It contains the bootstrap files plus enough skills, commands and hooks
+    to resemble the full 13-skill install.
+    """
+    rng = random.Random(0)
+    files = {rel: 12000 for rel in bootstrap.BOOTSTRAP_FILES}
+    for index in range(12):
+        files[f"skills/skill-{index:02d}/SKILL.md"] = 8000
+        files[f"skills/skill-{index:02d}/scripts/helper.py"] = 16000
+        files[f"skills/skill-{index:02d}/references/guide.md"] = 24000
+    for index in range(6):
+        files[f"commands/command-{index}.md"] = 2000
+        files[f"hooks/hook-{index}.py"] = 3000
+    for rel, size in sorted(files.items()):
+        path = claude_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(synthetic_text(rng, size), encoding="utf-8")
+
+
+def prepare_site(site_dir: Path, tree=None):
+    """
+    Build the directory served by the stand-in.
+
+    The same tree is also published under UNVERIFIED_DIR without a
+    manifest, as GitHub serves the repository today.
+
+    Args:
+        site_dir: Empty directory to populate
+        tree: .claude directory to serve; defaults to the repository's own,
+            or a synthetic tree if the checkout has none
+
+    Returns:
+        dict: Manifest of the served tree
+    """
+    claude_dir = site_dir / ".claude"
+    source = tree or REPO_ROOT / ".claude"
+    if source.is_dir():
+        shutil.copytree(str(source), str(claude_dir))
+    else:
+        write_synthetic_tree(claude_dir)
+
+    version = (REPO_ROOT / "VERSION").read_text(encoding="utf-8").strip()
+    (site_dir / "VERSION").write_text(version + "\n", encoding="utf-8")
+    manifest = bootstrap.build_manifest(claude_dir, version)
+
+    unverified_dir = site_dir / UNVERIFIED_DIR
+    unverified_dir.mkdir()
+    shutil.copy2(str(site_dir / "VERSION"), str(unverified_dir / "VERSION"))
+    shutil.copytree(str(claude_dir), str(unverified_dir / ".claude"))
+    (claude_dir / bootstrap.MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    for root in (site_dir, unverified_dir):
+        with tarfile.open(root / ARCHIVE_NAME, "w:gz") as tar:
+            tar.add(str(root / "VERSION"), arcname="iw-main/VERSION")
+            tar.add(str(root / ".claude"), arcname="iw-main/.claude")
+    return manifest
+
+
+def run_main(argv):
+    """
+    Run bootstrap.main() quietly with fresh connections.
+
+    Returns:
+        tuple: (elapsed seconds, exit code)
+    """
+    bootstrap.CONNECTION_POOL.close()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        code = bootstrap.main(argv)
+    return time.perf_counter() - start, code
+
+
+def run_processes(argvs):
+    """
+    Run one bootstrap.py process per argument list, all at once.
+
+    Returns:
+        tuple: (elapsed seconds until the last one exits, list of exit codes)
+    """
+    start = time.perf_counter()
+    processes = [
+        subprocess.Popen(
+            [sys.executable, str(REPO_ROOT / "bootstrap.py")] + argv,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL
+        )
+        for argv in argvs
+    ]
+    codes = [process.wait() for process in processes]
+    return time.perf_counter() - start, codes
+
+
+def corrupt_install(install_dir: Path):
+    """Modify one installed bootstrap file and delete another."""
+    modified = install_dir / bootstrap.BOOTSTRAP_FILES[0]
+    modified.write_bytes(modified.read_bytes()[: modified.stat().st_size // 2])
+    (install_dir / bootstrap.BOOTSTRAP_FILES[-1]).unlink()
+
+
+def install_matches(install_dir: Path, manifest, files) -> bool:
+    """Return True if every one of files is installed with its manifest hash."""
+    return all(bootstrap.file_matches(install_dir / rel, manifest["files"][rel]) for rel in files)
+
+
+def run_scenario(server, workdir: Path, manifest, mode: str, scenario: str,
+                 repeat: int, jobs: int, concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    Time one scenario repeatedly, each time in a fresh install and cache.
+
+    A run fails if bootstrap.py exits non-zero or leaves files that do not
+    match the served tree. The concurrent scenario starts one process per
+    target, all sharing a cache dir, and fails if any of them does.
+
+    Returns:
+        dict: Timing and request statistics
+    """
+    expected = list(manifest["files"]) if mode == "bulk" else bootstrap.BOOTSTRAP_FILES
+    times = []
+    requests = []
+    transferred = []
+    failures = 0
+    for _ in range(repeat):
+        run_dir = Path(tempfile.mkdtemp(dir=str(workdir)))
+        source = f"{server.url}/{UNVERIFIED_DIR}" if scenario == "unverified" else server.url
+        targets = [run_dir / f"project-{index}" for index in range(concurrency if scenario == "concurrent" else 1)]
+        argvs = [
+            [
+                "--source", source,
+                "--archive-url", f"{source}/{ARCHIVE_NAME}",
+                "--cache-dir", str(run_dir / "cache"),
+                "--target", str(target),
+                "--jobs", str(jobs),
+            ] + (["--bulk"] if mode == "bulk" else [])
+            for target in targets
+        ]
+        argv = argvs[0]
+        target = targets[0]
+
+        if scenario not in ("cold", "concurrent", "unverified"):
+            _, code = run_main(argv)
+            if code != 0:
+                failures += 1
+                shutil.rmtree(str(run_dir), ignore_errors=True)
+                continue
+        if scenario == "cache":
+            shutil.rmtree(str(target))
+        elif scenario == "corrupt":
+            corrupt_install(target / ".claude")
+
+        server.reset_stats()
+        if scenario == "concurrent":
+            elapsed, codes = run_processes(argvs)
+        else:
+            elapsed, code = run_main(argv)
+            codes = [code]
+        stats = server.snapshot()
+        intact = all(code == 0 for code in codes) and all(
+            install_matches(target / ".claude", manifest, expected) for target in targets
+        )
+        shutil.rmtree(str(run_dir), ignore_errors=True)
+        if not intact:
+            failures += 1
+            continue
+        times.append(elapsed)
+        requests.append(stats["requests"])
+        transferred.append(stats["bytes"])
+
+    result = {"runs": len(times), "failures": failures}
+    if times:
+        result.update(
+            median_s=round(statistics.median(times), 4),
+            min_s=round(min(times), 4),
+            max_s=round(max(times), 4),
+            requests=statistics.median(requests),
+            bytes=statistics.median(transferred),
+        )
+    return result
+
+
+def compare(results, baseline, threshold: float):
+    """
+    Compare results with a saved baseline.
+
+    A scenario regresses when it fails more often than before, when its
+    median time grows by more than threshold (and by more than MIN_DELTA),
+    or when it issues more requests than before. Request counts are only
+    compared when no errors are injected.
+
+    Returns:
+        list: Human-readable regression descriptions
+    """
+    regressions = []
+    deterministic = results["config"]["error_rate"] == 0 and baseline["config"]["error_rate"] == 0
+    for name, current in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if not previous:
+            continue
+        if current["failures"] > previous["failures"]:
+            regressions.append(f"{name}: failures {previous['failures']} -> {current['failures']}")
+        if "median_s" not in previous or "median_s" not in current:
+            continue
+        old, new = previous["median_s"], current["median_s"]
+        if new > old * (1 + threshold) and new - old > MIN_DELTA:
+            regressions.append(f"{name}: median {old * 1000:.1f} ms -> {new * 1000:.1f} ms")
+        if deterministic and current["requests"] > previous["requests"]:
+            regressions.append(f"{name}: requests {previous['requests']} -> {current['requests']}")
+    return regressions
+
+
+def print_results(results, baseline=None):
+    """Print a table of scenario results, with baseline medians if given."""
+    print()
+    print(f"{'scenario':<16} {'median':>10} {'min':>10} {'requests':>9} {'bytes':>10} {'fail':>5}  baseline")
+    print("-" * 76)
+    for name, result in results["scenarios"].items():
+        if "median_s" not in result:
+            print(f"{name:<16} {'-':>10} {'-':>10} {'-':>9} {'-':>10} {result['failures']:>5}")
+            continue
+        previous = (baseline or {}).get("scenarios", {}).get(name, {})
+        reference = f"{previous['median_s'] * 1000:.1f} ms" if "median_s" in previous else ""
+        print(
+            f"{name:<16} {result['median_s'] * 1000:>8.1f}ms {result['min_s'] * 1000:>8.1f}ms "
+            f"{result['requests']:>9g} {result['bytes']:>10g} {result['failures']:>5}  {reference}"
+        )
+    print()
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Benchmark bootstrap.py against a local HTTP stand-in.")
+    parser.add_argument("--latency", type=float, default=0, help="Added latency per request in ms (default: 0)")
+    parser.add_argument("--bandwidth", type=int, default=0, help="Bandwidth cap in KiB/s (default: unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of responses that fail (default: 0)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for error injection (default: 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario (default: 5)")
+    parser.add_argument("--jobs", type=int, default=bootstrap.DEFAULT_JOBS, help="bootstrap.py --jobs value")
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Processes in the concurrent scenario (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument("--mode", choices=MODES, action="append", help="Only run this mode; may be repeated")
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="Only run this scenario; may be repeated")
+    parser.add_argument("--tree", type=Path, help="Serve this .claude directory instead of the repository's")
+    parser.add_argument("--save", type=Path, metavar="FILE", help="Save results as a baseline")
+    parser.add_argument("--compare", type=Path, metavar="FILE", help="Compare with a saved baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Allowed median slowdown before --compare fails (default: {DEFAULT_THRESHOLD})"
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+def main(argv=None):
+    """
+    Run the benchmarks.
+
+    Returns:
+        int: 0 on success, 1 if --compare found a regression
+    """
+    args = parse_args(argv)
+
+    baseline = None
+    if args.compare is not None:
+        try:
+            baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read baseline {args.compare}: {e}")
+            return 1
+
+    workdir = Path(tempfile.mkdtemp(prefix="iw-bench-"))
+    try:
+        site_dir = workdir / "site"
+        site_dir.mkdir()
+        manifest = prepare_site(site_dir, args.tree)
+        file_count = len(manifest["files"])
+        server = ShapedHTTPServer(
+            site_dir, args.latency / 1000, args.bandwidth * 1024, args.error_rate, args.seed
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        bandwidth = f"{args.bandwidth} KiB/s" if args.bandwidth else "unlimited"
+        print(f"Serving {file_count} files from {server.url} "
+              f"(latency {args.latency:g} ms, bandwidth {bandwidth}, error rate {args.error_rate:g})")
+
+        results = {
+            "config": {
+                "latency_ms": args.latency,
+                "bandwidth_kib": args.bandwidth,
+                "error_rate": args.error_rate,
+                "jobs": args.jobs,
+                "concurrency": args.concurrency,
+                "repeat": args.repeat,
+                "files": file_count,
+                "python": sys.version.split()[0],
+            },
+            "scenarios": {},
+        }
+        for mode in args.mode or MODES:
+            for scenario in args.scenario or SCENARIOS:
+                if scenario in BULK_ONLY_SCENARIOS and mode != "bulk":
+                    continue
+                name = f"{mode}/{scenario}"
+                print(f"  {name}...")
+                results["scenarios"][name] = run_scenario(
+                    server, workdir, manifest, mode, scenario, args.repeat, args.jobs, args.concurrency
+                )
+        server.shutdown()
+        server.server_close()
+    finally:
+        bootstrap.CONNECTION_POOL.close()
+        shutil.rmtree(str(workdir), ignore_errors=True)
+
+    print_results(results, baseline)
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline to {args.save}")
+
+    if baseline is not None:
+        previous = baseline.get("config", {})
+        if previous.get("files") != results["config"]["files"]:
+            print("Warning: baseline was recorded with a different file tree")
+        if any(previous.get(key) != results["config"][key]
+               for key in ("latency_ms", "bandwidth_kib", "error_rate", "jobs", "concurrency")):
+            print("Warning: baseline was recorded with different shaping settings")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Performance regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
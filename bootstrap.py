@@ -8,7 +8,11 @@ install the full Implementation Workflow.
 Supports Windows, macOS, and Linux without requiring bash.
 
 Usage:
-    python3 bootstrap.py
+    python3 bootstrap.py [--jobs N] [--bulk] [--source URL|DIR|BUNDLE]
+    python3 bootstrap.py --project | --user | --target DIR ... | --targets-file FILE
+    python3 bootstrap.py --trace <trace.json|trace.jsonl> ...
+    python3 bootstrap.py --export-bundle <file.tar.gz>
+    python3 bootstrap.py --write-manifest <repo-dir>
 """
 
 # Configure UTF-8 encoding for Windows
@@ -19,13 +23,901 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+import argparse
+import base64
+import contextlib
+import errno
+import hashlib
+import http.client
+import json
+import os
+import platform
+import shutil
+import socket
+import ssl
+import tarfile
+import tempfile
+import threading
+import time
 import urllib.request
 import urllib.error
-from pathlib import Path
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from urllib.parse import unquote, urljoin, urlsplit
 
 # Configuration
 REPO_URL = "https://raw.githubusercontent.com/jumppad-labs/iw/main"
+ARCHIVE_URL = "https://codeload.github.com/jumppad-labs/iw/tar.gz/refs/heads/main"
+MANIFEST_FILE = "MANIFEST.json"
 SKILL_NAME = "iw-install"
+BUNDLE_PREFIX = "iw-bundle"
+STATE_FILE = ".bootstrap-state.json"
+DEFAULT_JOBS = 8
+HTTP_TIMEOUT = 30
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_RETRIES = 3
+DEFAULT_CACHE_MAX_MB = 64
+STALE_STAGING_SECONDS = 24 * 3600
+USER_AGENT = "iw-bootstrap"
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones
+
+STATUS_INSTALLED = "installed"
+STATUS_CURRENT = "up to date"
+STATUS_FAILED = "failed"
+
+# Files installed by the bootstrap, relative to the .claude directory
+BOOTSTRAP_FILES = [
+    f"skills/{SKILL_NAME}/SKILL.md",
+    f"skills/{SKILL_NAME}/scripts/manage_workflow.py",
+    f"commands/{SKILL_NAME}.md",
+]
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or not an integer
+
+    Returns:
+        int: The configured value
+    """
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Install the iw-install skill for the Implementation Workflow."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=env_int("IW_JOBS", DEFAULT_JOBS),
+        help=f"Maximum concurrent downloads (env: IW_JOBS, default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--source",
+        default=os.environ.get("IW_SOURCE", REPO_URL),
+        help="Where to install from: an http(s) URL, a local checkout or mirror "
+             "directory, a file:// URL, or a bundle from --export-bundle "
+             "(env: IW_SOURCE, default: GitHub)"
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default=os.environ.get("IW_LINK_MODE", "auto"),
+        help="How files from a local source are placed: reflink, hardlink or "
+             "copy; auto tries a reflink, then a copy (env: IW_LINK_MODE)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(os.environ.get("IW_CACHE_DIR") or default_cache_dir()),
+        help="Download cache location (env: IW_CACHE_DIR, default: ~/.cache/iw)"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=env_int("IW_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB),
+        help=f"Evict least recently used cache entries above this size "
+             f"(env: IW_CACHE_MAX_MB, default: {DEFAULT_CACHE_MAX_MB})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=bool(os.environ.get("IW_NO_CACHE")),
+        help="Always download files instead of revalidating a cached copy (env: IW_NO_CACHE)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=bool(os.environ.get("IW_FORCE")),
+        help="Reinstall every file even if the installed version is current (env: IW_FORCE)"
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        default=bool(os.environ.get("IW_BULK")),
+        help="Install the full .claude tree from one release archive (env: IW_BULK)"
+    )
+    parser.add_argument(
+        "--archive-url",
+        default=os.environ.get("IW_ARCHIVE_URL"),
+        help="Release archive used by --bulk and --export-bundle; defaults to GitHub's, and "
+             "is required when --source is another HTTP server (env: IW_ARCHIVE_URL)"
+    )
+    location = parser.add_argument_group(
+        "non-interactive installation",
+        "Any of these skips the installation prompt. Targets are project or "
+        "home directories; files go into their .claude subdirectory."
+    )
+    location.add_argument(
+        "--project",
+        action="store_true",
+        help="Install into .claude in the current directory"
+    )
+    location.add_argument(
+        "--user",
+        action="store_true",
+        help="Install into ~/.claude"
+    )
+    location.add_argument(
+        "--target",
+        action="append",
+        type=Path,
+        default=[],
+        metavar="DIR",
+        help=f"Install into DIR/.claude; may be repeated (env: IW_TARGETS, "
+             f"separated by '{os.pathsep}')"
+    )
+    location.add_argument(
+        "--targets-file",
+        type=Path,
+        default=os.environ.get("IW_TARGETS_FILE"),
+        metavar="FILE",
+        help="Read target directories from FILE, one per line (env: IW_TARGETS_FILE)"
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=os.environ.get("IW_TRACE") or None,
+        metavar="FILE",
+        help="Write per-phase timings to FILE: Chrome trace format, or JSON lines "
+             "if FILE ends in .jsonl (env: IW_TRACE)"
+    )
+    parser.add_argument(
+        "--export-bundle",
+        type=Path,
+        metavar="FILE",
+        help="Write the full .claude tree from --source to a bundle file for offline installs and exit"
+    )
+    parser.add_argument(
+        "--write-manifest",
+        type=Path,
+        metavar="REPO_DIR",
+        help=f"Write .claude/{MANIFEST_FILE} for a repository checkout and exit"
+    )
+    args = parser.parse_args(argv)
+    if args.link_mode not in LINK_MODES:
+        parser.error(f"--link-mode must be one of: {', '.join(LINK_MODES)}")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.archive_url is None:
+        mirror = (urlsplit(args.source).scheme in ("http", "https")
+                  and args.source.rstrip("/") != REPO_URL.rstrip("/"))
+        if not mirror:
+            args.archive_url = ARCHIVE_URL
+        elif args.bulk or args.export_bundle is not None:
+            # GitHub's archive could be unreachable, or newer than the mirror
+            parser.error("--archive-url is required with --bulk or --export-bundle "
+                         "when --source is an HTTP mirror")
+    return args
+
+
+class Tracer:
+    """
+    Collects timed spans and counters for --trace.
+
+    Spans are recorded per thread, so concurrent downloads show up as
+    separate lanes in a Chrome trace viewer. A disabled tracer records
+    nothing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self.counters = {}
+        self.metadata = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._start_time = time.time()
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "bootstrap", **args):
+        """
+        Time the enclosed block.
+
+        Yields the span's args dict so the block can attach results to it.
+        """
+        if not self.enabled:
+            yield args
+            return
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = str(e) or type(e).__name__
+            raise
+        finally:
+            self.add(name, cat, start, time.perf_counter(), args)
+
+    def reset(self, enabled: bool = False):
+        """Discard everything recorded so far and restart the clock."""
+        with self._lock:
+            self.enabled = enabled
+            self.spans = []
+            self.counters = {}
+            self.metadata = {}
+            self._origin = time.perf_counter()
+            self._start_time = time.time()
+
+    def add(self, name: str, cat: str, start: float, end: float, args=None):
+        """Record a span given perf_counter() start and end times."""
+        if not self.enabled:
+            return
+        span = {
+            "name": name,
+            "cat": cat,
+            "start": start - self._origin,
+            "duration": end - start,
+            "thread": threading.get_ident(),
+            "args": dict(args or {}),
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def count(self, name: str, value: int = 1):
+        """Add value to a named counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def write(self, path: Path):
+        """Write everything recorded so far to path."""
+        meta = {
+            "start_time": self._start_time,
+            "host": platform.node(),
+            "platform": sys.platform,
+            "python": platform.python_version(),
+        }
+        meta.update(self.metadata)
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span["start"])
+            counters = dict(self.counters)
+
+        if path.suffix == ".jsonl":
+            lines = [dict(type="meta", **meta)]
+            lines += [dict(type="span", **span) for span in spans]
+            lines += [{"type": "counter", "name": k, "value": v} for k, v in sorted(counters.items())]
+            text = "".join(json.dumps(line) + "\n" for line in lines)
+        else:
+            pid = os.getpid()
+            events = [
+                {
+                    "name": span["name"],
+                    "cat": span["cat"],
+                    "ph": "X",
+                    "ts": round(span["start"] * 1e6, 1),
+                    "dur": round(span["duration"] * 1e6, 1),
+                    "pid": pid,
+                    "tid": span["thread"],
+                    "args": span["args"],
+                }
+                for span in spans
+            ]
+            end = max((e["ts"] + e["dur"] for e in events), default=0)
+            events.append({"name": "counters", "ph": "C", "ts": end, "pid": pid, "args": counters})
+            text = json.dumps({"traceEvents": events, "displayTimeUnit": "ms", "otherData": meta})
+        path.write_text(text, encoding="utf-8")
+
+
+TRACER = Tracer()
+
+
+def _traced_connect(conn):
+    """Open conn.sock like HTTPConnection.connect(), timing DNS and TCP connect separately."""
+    with TRACER.span("dns", "net", host=conn.host):
+        addresses = socket.getaddrinfo(conn.host, conn.port, 0, socket.SOCK_STREAM)
+    with TRACER.span("connect", "net", host=conn.host, port=conn.port):
+        error = OSError(f"no addresses for {conn.host}")
+        for family, socktype, proto, _, address in addresses:
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.settimeout(conn.timeout)
+                sock.connect(address)
+                break
+            except OSError as e:
+                sock.close()
+                error = e
+        else:
+            raise error
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    conn.sock = sock
+    if conn._tunnel_host:
+        conn._tunnel()
+
+
+class TracedHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that records connection setup spans."""
+
+    def connect(self):
+        _traced_connect(self)
+
+
+class TracedHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that records connection setup and TLS handshake spans."""
+
+    def connect(self):
+        _traced_connect(self)
+        server_hostname = self._tunnel_host or self.host
+        with TRACER.span("tls", "net", host=server_hostname):
+            self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname)
+
+
+class HTTPResponse:
+    """
+    A response borrowed from a ConnectionPool.
+
+    Transparently decodes gzip bodies and hands the connection back to the
+    pool once the body has been fully read and the response is closed.
+    """
+
+    def __init__(self, pool, key, conn, raw, url: str):
+        self.url = url
+        self.status = raw.status
+        self.headers = raw.headers
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._raw = raw
+        self._buffer = bytearray()
+        self._eof = False
+        self._error = None
+        self._started = time.perf_counter()
+        self._wire_bytes = 0
+        self._body_bytes = 0
+        encoding = raw.getheader("Content-Encoding", "").strip().lower()
+        self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == "gzip" else None
+
+    def _fill(self):
+        """Read and decode the next chunk of the body into the buffer."""
+        try:
+            chunk = self._raw.read(CHUNK_SIZE)
+            self._wire_bytes += len(chunk)
+            if not chunk:
+                if self._raw.length:
+                    # read(amt) reports a short body as EOF rather than raising
+                    raise http.client.IncompleteRead(bytes(self._buffer), self._raw.length)
+                if self._decoder is not None:
+                    self._buffer += self._decoder.flush()
+                    if not self._decoder.eof:
+                        raise zlib.error("gzip stream ended early")
+                self._eof = True
+            elif self._decoder is not None:
+                self._buffer += self._decoder.decompress(chunk)
+            else:
+                self._buffer += chunk
+        except (http.client.HTTPException, OSError, zlib.error) as e:
+            # A dropped connection mid-body is a download failure, not a local
+            # I/O error. Raise it once the bytes received so far are consumed.
+            self._error = urllib.error.URLError(e)
+            self._eof = True
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read decoded body bytes.
+
+        Args:
+            size: Maximum number of bytes to return, or -1 for the rest
+
+        Returns:
+            bytes: Decoded data, empty once the body is exhausted
+        """
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            self._fill()
+        if self._error is not None and (size < 0 or not self._buffer):
+            raise self._error
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        self._body_bytes += len(data)
+        return data
+
+    def close(self):
+        """Release the connection, returning it to the pool if reusable."""
+        if self._conn is None:
+            return
+        if not self._eof and self._raw.length is not None and self._raw.length <= CHUNK_SIZE:
+            # Drain short unread bodies (e.g. 304s) so the connection stays usable
+            try:
+                self._raw.read()
+                self._eof = True
+            except (http.client.HTTPException, OSError):
+                pass
+        reusable = self._eof and self._error is None and not self._raw.will_close
+        self._pool.release(self._key, self._conn, reusable=reusable)
+        self._conn = None
+        TRACER.add("body", "http", self._started, time.perf_counter(), {
+            "url": self.url,
+            "status": self.status,
+            "wire_bytes": self._wire_bytes,
+            "bytes": self._body_bytes,
+            "complete": self._eof and self._error is None,
+        })
+        TRACER.count("bytes_received", self._wire_bytes)
+        TRACER.count("bytes_decoded", self._body_bytes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections, one idle list per host.
+
+    Honours the same proxy environment variables as urllib (HTTPS_PROXY,
+    HTTP_PROXY, NO_PROXY).
+    """
+
+    def __init__(self, timeout: float = HTTP_TIMEOUT):
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def _connect(self, scheme: str, host: str, port: int):
+        """Open a new connection to host, tunnelling through a proxy if configured."""
+        http_class = TracedHTTPConnection if TRACER.enabled else http.client.HTTPConnection
+        https_class = TracedHTTPSConnection if TRACER.enabled else http.client.HTTPSConnection
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and not urllib.request.proxy_bypass(host):
+            proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            conn = http_class(
+                proxy_parts.hostname, proxy_parts.port or 80, timeout=self.timeout
+            ) if scheme == "http" else https_class(
+                proxy_parts.hostname, proxy_parts.port or 80,
+                timeout=self.timeout, context=self._ssl_context
+            )
+            proxy_headers = {}
+            if proxy_parts.username:
+                credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+                token = base64.b64encode(credentials.encode()).decode()
+                proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+            if scheme == "https":
+                conn.set_tunnel(host, port, headers=proxy_headers)
+                conn.iw_proxy_headers = None
+            else:
+                # Plain HTTP proxies take the absolute URL on every request
+                conn.iw_proxy_headers = proxy_headers
+            return conn
+
+        if scheme == "https":
+            conn = https_class(host, port, timeout=self.timeout, context=self._ssl_context)
+        else:
+            conn = http_class(host, port, timeout=self.timeout)
+        conn.iw_proxy_headers = None
+        return conn
+
+    def _acquire(self, key):
+        """Return an idle connection for key, or a fresh one. Second value is True if reused."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(*key), False
+
+    def release(self, key, conn, reusable: bool = True):
+        """
+        Return a connection to the pool.
+
+        Args:
+            key: (scheme, host, port) the connection belongs to
+            conn: The connection
+            reusable: False to close the connection instead of keeping it
+        """
+        if not reusable:
+            conn.close()
+            return
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def request(self, url: str, headers=None) -> HTTPResponse:
+        """
+        Issue a GET request, following redirects.
+
+        Args:
+            url: http:// or https:// URL to fetch
+            headers: Extra request headers
+
+        Returns:
+            HTTPResponse: The response for any 2xx or 304 status
+
+        Raises:
+            urllib.error.HTTPError: For any other status
+            urllib.error.URLError: If the connection fails
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request_once(url, headers or {})
+            if response.status in (301, 302, 303, 307, 308):
+                location = response.headers.get("Location")
+                response.read()
+                response.close()
+                if not location:
+                    break
+                url = urljoin(url, location)
+                continue
+            if 200 <= response.status < 300 or response.status == 304:
+                return response
+            response.read()
+            response.close()
+            raise urllib.error.HTTPError(
+                url, response.status, http.client.responses.get(response.status, ""),
+                response.headers, None
+            )
+        raise urllib.error.URLError(f"too many redirects for {url}")
+
+    def _request_once(self, url: str, headers) -> HTTPResponse:
+        """Send one request on a pooled connection, retrying once if a kept-alive socket went stale."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported URL scheme: {url}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request_headers = {
+            "Host": parts.netloc,
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip",
+        }
+        request_headers.update(headers)
+
+        while True:
+            conn, reused = self._acquire(key)
+            target = path
+            if conn.iw_proxy_headers is not None:
+                target = url
+                request_headers.update(conn.iw_proxy_headers)
+            try:
+                # New connections are opened lazily by request(), so "send"
+                # includes connection setup and "ttfb" is the server's wait
+                with TRACER.span("send", "http", url=url, reused=reused):
+                    conn.request("GET", target, headers=request_headers)
+                with TRACER.span("ttfb", "http", url=url) as span:
+                    raw = conn.getresponse()
+                    span["status"] = raw.status
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if reused:
+                    continue
+                raise urllib.error.URLError(e)
+            return HTTPResponse(self, key, conn, raw, url)
+
+
+CONNECTION_POOL = ConnectionPool()
+
+
+def default_cache_dir() -> Path:
+    """Return the platform's per-user cache directory for downloads."""
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "iw" / "cache"
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "iw"
+    return Path.home() / ".cache" / "iw"
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fsync_file(path: Path):
+    """Flush a file's content to disk without needing write permission on it."""
+    # Windows can only flush handles opened for writing
+    fd = os.open(path, (os.O_RDWR | os.O_BINARY) if sys.platform == "win32" else os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def reflink(source: Path, dest: Path):
+    """
+    Create dest as a copy-on-write clone of source.
+
+    Raises:
+        OSError: If the platform or filesystem does not support clones
+    """
+    if sys.platform == "darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(str(source)), os.fsencode(str(dest)), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(dest))
+        return
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported on this platform")
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            dest.unlink()
+            raise
+
+
+def materialize(source: Path, dest: Path, mode: str = "auto") -> str:
+    """
+    Place the content of source at dest as cheaply as mode allows.
+
+    Reflinks share storage copy-on-write. Hardlinks share the file itself,
+    so an in-place edit of dest also changes source; they are only used
+    when asked for explicitly. Either falls back to a byte copy when the
+    filesystem cannot do it.
+
+    Args:
+        source: Existing file
+        dest: Path to create, replacing any existing file
+        mode: One of LINK_MODES
+
+    Returns:
+        str: The method used ("reflink", "hardlink" or "copy")
+    """
+    if dest.exists() or dest.is_symlink():
+        dest.unlink()
+    if mode in ("auto", "reflink"):
+        try:
+            reflink(source, dest)
+            shutil.copymode(source, dest)
+            return "reflink"
+        except OSError:
+            pass
+    if mode == "hardlink":
+        try:
+            os.link(source, dest)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copyfile(source, dest)
+    shutil.copymode(source, dest)
+    return "copy"
+
+
+class DownloadCache:
+    """
+    Content-addressed on-disk cache of downloaded files.
+
+    Bodies are stored once per SHA-256 under ``objects/``. ``index.json``
+    maps each URL to its object along with the ETag/Last-Modified values
+    needed for a conditional request, and a last-used time for LRU
+    eviction. Cache failures never fail an install; the file is simply
+    downloaded again.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = root / "index.json"
+        self._lock = threading.Lock()
+        try:
+            self._entries = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def object_path(self, sha256: str) -> Path:
+        """Return the storage path for an object digest."""
+        return self.root / "objects" / sha256[:2] / sha256
+
+    def conditional_headers(self, url: str):
+        """
+        Return If-None-Match/If-Modified-Since headers for a cached URL.
+
+        Returns:
+            dict: Request headers, empty if the URL is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry or not self.object_path(entry["sha256"]).exists():
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def materialize(self, url: str, dest_path: Path) -> bool:
+        """
+        Place the cached body for url at dest_path without copying when possible.
+
+        The object is verified against its digest first, and is cloned or
+        copied rather than hardlinked, so editing dest_path later cannot
+        change the cached copy.
+
+        Returns:
+            bool: True if dest_path now holds the cached body
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return False
+        obj = self.object_path(entry["sha256"])
+        try:
+            if file_sha256(obj) != entry["sha256"]:
+                obj.unlink()
+                self.forget(url)
+                return False
+            materialize(obj, dest_path, "reflink")
+        except OSError:
+            self.forget(url)
+            return False
+        with self._lock:
+            entry["used"] = time.time()
+        return True
+
+    def store(self, url: str, path: Path, headers):
+        """
+        Add a freshly downloaded file to the cache.
+
+        Args:
+            url: URL the file was downloaded from
+            path: The downloaded file
+            headers: Response headers carrying ETag/Last-Modified
+        """
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+        try:
+            sha256 = file_sha256(path)
+            obj = self.object_path(sha256)
+            if not obj.exists():
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp = obj.with_name(f".{sha256}.{os.getpid()}.{threading.get_ident()}.tmp")
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, obj)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[url] = {
+                "sha256": sha256,
+                "size": path.stat().st_size,
+                "etag": etag,
+                "last_modified": last_modified,
+                "used": time.time(),
+            }
+
+    def forget(self, url: str):
+        """Drop the index entry for url."""
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def save(self):
+        """Evict least recently used objects over the size limit and write the index."""
+        with self._lock:
+            entries = dict(self._entries)
+        sizes = {}
+        for entry in entries.values():
+            sizes[entry["sha256"]] = entry["size"]
+        total = sum(sizes.values())
+
+        for url, entry in sorted(entries.items(), key=lambda item: item[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            del entries[url]
+            sha256 = entry["sha256"]
+            if sha256 in sizes and not any(e["sha256"] == sha256 for e in entries.values()):
+                total -= sizes.pop(sha256)
+                try:
+                    self.object_path(sha256).unlink()
+                except OSError:
+                    pass
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(f".index.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass
+        with self._lock:
+            self._entries = entries
+
+
+def read_targets_file(path: Path):
+    """
+    Read target directories from a file, one per line.
+
+    Blank lines and lines starting with # are ignored.
+
+    Returns:
+        list: Target paths
+    """
+    targets = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            targets.append(Path(line))
+    return targets
+
+
+def collect_targets(args):
+    """
+    Resolve the installation directories requested on the command line or environment.
+
+    A target that already names a .claude directory is used as is.
+
+    Returns:
+        list: Installation .claude directories in request order without
+        duplicates, empty if the user should be prompted instead
+    """
+    targets = []
+    if args.project:
+        targets.append(Path.cwd())
+    if args.user:
+        targets.append(Path.home())
+    targets.extend(args.target)
+    if not args.target and os.environ.get("IW_TARGETS"):
+        targets.extend(Path(t) for t in os.environ["IW_TARGETS"].split(os.pathsep) if t)
+    if args.targets_file is not None:
+        targets.extend(read_targets_file(Path(args.targets_file)))
+
+    install_dirs = []
+    for target in targets:
+        target = target.expanduser().absolute()
+        install_dir = target if target.name == ".claude" else target / ".claude"
+        if install_dir not in install_dirs:
+            install_dirs.append(install_dir)
+    return install_dirs
 
 
 def print_header():
@@ -44,7 +936,8 @@ def get_installation_choice():
     Prompt user for installation location.
 
     Returns:
-        tuple: (install_dir: Path, install_type: str)
+        tuple: (install_dir: Path, install_type: str), or None if there is
+        no interactive input to read from
     """
     print("Where would you like to install the workflow?")
     print()
@@ -60,7 +953,12 @@ def get_installation_choice():
     print()
 
     while True:
-        choice = input("Enter choice [1 or 2]: ").strip()
+        try:
+            choice = input("Enter choice [1 or 2]: ").strip()
+        except EOFError:
+            print()
+            print("No input available. Use --project, --user or --target to run unattended.")
+            return None
 
         if choice == "1":
             install_dir = Path.cwd() / ".claude"
@@ -78,95 +976,1184 @@ def get_installation_choice():
             print("Invalid choice. Please enter 1 or 2.")
 
 
-def download_file(url: str, dest_path: Path) -> bool:
+def staging_path(dest_path: Path) -> Path:
+    """
+    Return the hidden sibling path a download is staged to before commit.
+
+    Staging next to the destination keeps the final rename on one filesystem.
+    """
+    return dest_path.with_name(f".{dest_path.name}.part")
+
+
+def resume_meta_path(part_path: Path) -> Path:
+    """Return the sidecar file recording the validator a partial download was started with."""
+    return part_path.with_name(f"{part_path.name}.meta")
+
+
+def resume_validator(response) -> str:
+    """
+    Pick a validator usable with If-Range from response headers.
+
+    Weak ETags are not allowed in If-Range, so fall back to Last-Modified.
+
+    Returns:
+        str: Strong ETag, Last-Modified date, or "" if neither is available
+    """
+    etag = response.headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified", "")
+
+
+def expected_size(response):
+    """
+    Return the full size of the file a response carries, if the headers tell.
+
+    A 206 states it in Content-Range. A 200 states it in Content-Length
+    unless the body is compressed, in which case only the encoded size is
+    known (and HTTPResponse already checks that).
+
+    Returns:
+        int or None: Size in bytes, or None if it is not known
+    """
+    if response.status == 206:
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+    if response.headers.get("Content-Encoding", "identity").strip().lower() != "identity":
+        return None
+    length = response.headers.get("Content-Length", "").strip()
+    return int(length) if length.isdigit() else None
+
+
+def _stream_to(url: str, dest_path: Path, meta_path: Path, cache=None):
+    """
+    Stream one response body into dest_path, appending if a resumable partial exists.
+
+    Without a partial, the request is made conditional on the cached copy
+    (if any), and a 304 is satisfied from the cache. The finished file is
+    checked against the size the server announced.
+
+    Returns:
+        Response headers of a fresh download, or None if served from the cache
+
+    Raises:
+        urllib.error.URLError: If the download fails
+        OSError: If the file cannot be written
+    """
+    offset = 0
+    headers = {}
+    if dest_path.exists() and meta_path.exists():
+        try:
+            validator = json.loads(meta_path.read_text(encoding="utf-8"))["validator"]
+        except (ValueError, KeyError, OSError):
+            validator = ""
+        offset = dest_path.stat().st_size
+        if validator and offset:
+            # Ranges address the identity encoding, so don't negotiate gzip here
+            headers = {
+                "Range": f"bytes={offset}-",
+                "If-Range": validator,
+                "Accept-Encoding": "identity",
+            }
+    if not headers and cache is not None:
+        headers = cache.conditional_headers(url)
+    resume = "Range" in headers
+
+    try:
+        response = CONNECTION_POOL.request(url, headers)
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not resume:
+            raise
+        # The partial no longer fits the remote file; start over
+        dest_path.unlink()
+        return _stream_to(url, dest_path, meta_path, cache)
+
+    with response:
+        if response.status == 304:
+            if cache.materialize(url, dest_path):
+                TRACER.count("cache_hits")
+                return None
+            cache.forget(url)
+            return _stream_to(url, dest_path, meta_path, cache)
+
+        resuming = resume and response.status == 206
+        if resuming:
+            TRACER.count("resumed_downloads")
+            content_range = response.headers.get("Content-Range", "")
+            if not content_range.startswith(f"bytes {offset}-"):
+                raise urllib.error.URLError(f"unexpected Content-Range: {content_range!r}")
+        else:
+            validator = resume_validator(response)
+            if validator:
+                meta_path.write_text(json.dumps({"url": url, "validator": validator}), encoding="utf-8")
+            else:
+                try:
+                    meta_path.unlink()
+                except FileNotFoundError:
+                    pass
+            if dest_path.exists():
+                # Never truncate in place: the file may be linked to another copy
+                dest_path.unlink()
+
+        with open(dest_path, "ab" if resuming else "wb") as f:
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        size = dest_path.stat().st_size
+        expected = expected_size(response)
+        if expected is not None and size != expected:
+            # Not resumable: the bytes on disk are not a prefix we can trust
+            dest_path.unlink()
+            try:
+                meta_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise urllib.error.URLError(f"received {size} of {expected} bytes")
+        return response.headers
+
+
+def with_retries(action, retries: int = DOWNLOAD_RETRIES):
+    """
+    Call action(), retrying network failures and 5xx responses with exponential backoff.
+
+    Args:
+        action: Callable performing the request
+        retries: Number of additional attempts after a failure
+
+    Returns:
+        tuple: (result of action, number of retries used)
+
+    Raises:
+        urllib.error.URLError: The last failure, or an HTTP error other than 5xx
+    """
+    for attempt in range(retries + 1):
+        try:
+            return action(), attempt
+        except urllib.error.HTTPError as e:
+            if e.code < 500 or attempt == retries:
+                raise
+        except urllib.error.URLError:
+            if attempt == retries:
+                raise
+        TRACER.count("retries")
+        time.sleep(0.5 * 2 ** attempt)
+
+
+def download_file(url: str, dest_path: Path, retries: int = DOWNLOAD_RETRIES, cache=None):
     """
     Download a file from URL to destination path.
 
+    The body is streamed in chunks so memory use does not grow with file
+    size, and is fsynced before returning. If the connection drops, the
+    download is retried and resumed with an HTTP Range request; a partial
+    file left by an earlier run is resumed the same way.
+
+    With a cache, an unchanged file costs one conditional request that is
+    answered with 304 and served from the local copy.
+
     Args:
         url: Source URL to download from
         dest_path: Destination file path
+        retries: Number of additional attempts after a network failure
+        cache: Optional DownloadCache to revalidate against and populate
+
+    Raises:
+        urllib.error.URLError: If the download fails
+        OSError: If the file cannot be written
+    """
+    # Ensure parent directory exists
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    meta_path = resume_meta_path(dest_path)
+
+    with TRACER.span("download", "http", url=url) as span:
+        headers, span["retries"] = with_retries(
+            lambda: _stream_to(url, dest_path, meta_path, cache), retries
+        )
+        span["cache_hit"] = headers is None
+
+    try:
+        meta_path.unlink()
+    except FileNotFoundError:
+        pass
+    if cache is not None and headers is not None:
+        cache.store(url, dest_path, headers)
+
+
+def commit_staged(dests):
+    """
+    Atomically rename each staged file onto its destination.
+
+    Args:
+        dests: Destination paths whose staging files are complete
+
+    Raises:
+        OSError: If a file cannot be moved into place
+    """
+    for dest in dests:
+        os.replace(staging_path(dest), dest)
+
+
+def discard_staged(dests):
+    """Remove the staging files for dests, ignoring ones that do not exist."""
+    for dest in dests:
+        try:
+            staging_path(dest).unlink()
+        except OSError:
+            pass
+
+
+def download_files(files, jobs: int = DEFAULT_JOBS, cache=None) -> bool:
+    """
+    Download several files concurrently with all-or-nothing semantics.
+
+    Every file is fetched to a staging path first. Only when all downloads
+    succeed are the staged files atomically renamed into place, so a failure
+    or interrupt never leaves a partially installed skill behind. Partial
+    downloads that can be resumed are kept for the next run. Errors are
+    reported in the order of ``files`` regardless of which download
+    finished first.
+
+    Args:
+        files: Sequence of (url, dest_path) tuples
+        jobs: Maximum number of concurrent downloads
+        cache: Optional DownloadCache shared by all downloads
 
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if every file was installed, False otherwise
+    """
+    def fetch(entry):
+        url, dest = entry
+        try:
+            download_file(url, staging_path(dest), cache=cache)
+        except (urllib.error.URLError, OSError) as e:
+            return e
+        return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(files)))) as pool:
+        errors = list(pool.map(fetch, files))
+
+    failed = False
+    for (url, dest), error in zip(files, errors):
+        if isinstance(error, urllib.error.URLError):
+            print(f"  Error: Failed to download {url}")
+            print(f"  {error}")
+            failed = True
+        elif error is not None:
+            print(f"  Error: Failed to write to {dest}")
+            print(f"  {error}")
+            failed = True
+
+    if not failed:
+        try:
+            commit_staged([dest for _, dest in files])
+            return True
+        except OSError as e:
+            print(f"  Error: Failed to install downloaded files: {e}")
+
+    # Keep partial downloads that the next run can resume
+    discard_staged([
+        dest for (_, dest), error in zip(files, errors)
+        if error is None or not resume_meta_path(staging_path(dest)).exists()
+    ])
+    return False
+
+
+def state_path(install_dir: Path) -> Path:
+    """Return the install state file for an installation directory."""
+    return install_dir / "skills" / SKILL_NAME / STATE_FILE
+
+
+def load_install_state(install_dir: Path):
+    """
+    Load the record of a previous bootstrap into install_dir.
+
+    Returns:
+        dict: State with "version", "source" and "files" keys, empty if absent
     """
     try:
-        with urllib.request.urlopen(url) as response:
-            content = response.read()
+        state = json.loads(state_path(install_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
 
-        # Ensure parent directory exists
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write content to file
-        dest_path.write_bytes(content)
-        return True
+def save_install_state(install_dir: Path, version, files, source_id: str):
+    """
+    Record the installed version and the SHA-256 of each installed file.
 
-    except urllib.error.URLError as e:
-        print(f"  Error: Failed to download {url}")
-        print(f"  {e}")
+    Args:
+        install_dir: Installation .claude directory
+        version: Installed version, or None if unknown
+        files: Installed paths relative to install_dir
+        source_id: Identifier of the source the files came from
+    """
+    state = {
+        "version": version,
+        "source": source_id,
+        "files": {rel: file_sha256(install_dir / rel) for rel in files},
+    }
+    path = state_path(install_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{STATE_FILE}.tmp")
+    tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def changed_files(install_dir: Path, state, files):
+    """
+    Return the files whose on-disk content no longer matches the install state.
+
+    Args:
+        install_dir: Installation .claude directory
+        state: State loaded by load_install_state()
+        files: Paths relative to install_dir to check
+
+    Returns:
+        list: Relative paths that are missing, modified, or not recorded
+    """
+    recorded = state.get("files", {})
+    changed = []
+    for rel in files:
+        try:
+            if file_sha256(install_dir / rel) == recorded.get(rel):
+                continue
+        except OSError:
+            pass
+        changed.append(rel)
+    return changed
+
+
+def build_manifest(claude_dir: Path, version):
+    """
+    Describe every distributable file under a .claude directory.
+
+    Args:
+        claude_dir: The .claude directory of a repository checkout
+        version: Workflow version the tree belongs to
+
+    Returns:
+        dict: {"version": ..., "files": {relative path: {"size", "sha256"}}}
+    """
+    files = {}
+    for path in sorted(claude_dir.rglob("*")):
+        rel = path.relative_to(claude_dir).as_posix()
+        if (not path.is_file() or rel == MANIFEST_FILE
+                or "__pycache__" in path.parts or path.suffix == ".pyc"):
+            continue
+        files[rel] = {"size": path.stat().st_size, "sha256": file_sha256(path)}
+    return {"version": version, "files": files}
+
+
+def write_manifest(repo_dir: Path) -> int:
+    """
+    Write .claude/MANIFEST.json for a repository checkout.
+
+    Args:
+        repo_dir: Repository root containing VERSION and .claude/
+
+    Returns:
+        int: Exit code
+    """
+    claude_dir = repo_dir / ".claude"
+    if not claude_dir.is_dir():
+        print(f"Error: {claude_dir} does not exist")
+        return 1
+    try:
+        version = (repo_dir / "VERSION").read_text(encoding="utf-8").strip() or None
+    except OSError:
+        version = None
+    manifest = build_manifest(claude_dir, version)
+    (claude_dir / MANIFEST_FILE).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(f"Wrote {claude_dir / MANIFEST_FILE} ({len(manifest['files'])} files)")
+    return 0
+
+
+def file_matches(path: Path, info) -> bool:
+    """Return True if path exists with the size and SHA-256 recorded in a manifest entry."""
+    try:
+        return path.stat().st_size == info["size"] and file_sha256(path) == info["sha256"]
+    except OSError:
         return False
-    except IOError as e:
-        print(f"  Error: Failed to write to {dest_path}")
+
+
+def archive_member_path(name: str):
+    """
+    Map an archive member name to a path relative to .claude.
+
+    Release archives hold a single top-level directory (e.g. ``iw-main/``)
+    containing the repository.
+
+    Returns:
+        str or None: Relative path, or None for members outside .claude
+        and names that would escape the install directory
+    """
+    parts = PurePosixPath(name).parts
+    if len(parts) < 3 or parts[1] != ".claude" or PurePosixPath(name).is_absolute():
+        return None
+    if any(part in ("", ".", "..") for part in parts[2:]):
+        return None
+    rel = "/".join(parts[2:])
+    return None if rel == MANIFEST_FILE else rel
+
+
+def extract_member(tar, member, dest_path: Path) -> str:
+    """
+    Stream one archive member to dest_path, hashing it on the way.
+
+    The file is not fsynced: extracted files are staging copies, and the
+    installed copy is synced by install_target().
+
+    Returns:
+        str: Hex SHA-256 of the extracted content
+    """
+    digest = hashlib.sha256()
+    source = tar.extractfile(member)
+    with open(dest_path, "wb") as f:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            f.write(chunk)
+    if member.mode & 0o111:
+        os.chmod(dest_path, dest_path.stat().st_mode | (member.mode & 0o111))
+    return digest.hexdigest()
+
+
+def hash_member(tar, member) -> str:
+    """Return the hex SHA-256 of an archive member without writing it anywhere."""
+    digest = hashlib.sha256()
+    source = tar.extractfile(member)
+    for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fetch_archive(archive_url: str, staging_dir: Path, expected=None, select=None):
+    """
+    Stream a release archive and extract the needed .claude entries into staging_dir.
+
+    Every entry is hashed and checked against the MANIFEST.json inside the
+    archive (or expected, if the archive has none), so the files always
+    match the revision the manifest describes. Only the entries select()
+    asks for are written to disk; the rest are hashed in passing. If the
+    archive's manifest differs from expected, select() is asked again, and
+    the archive is read a second time should that need entries already
+    passed over. An archive without any manifest is extracted in full and
+    installed unverified, with a warning. A download that fails part way
+    is retried from the start.
+
+    Args:
+        archive_url: URL of the tar.gz release archive
+        staging_dir: Directory to extract into
+        expected: Manifest the caller planned with, or None
+        select: Callable mapping a manifest to the set of paths to extract,
+            or None to extract everything
+
+    Returns:
+        dict or None: Manifest the extracted files were verified against,
+        or None on failure
+    """
+    def extract(plan):
+        wanted = None if select is None or plan is None else select(plan)
+        hashes = {}
+        written = set()
+        manifest = None
+        with CONNECTION_POOL.request(archive_url) as response:
+            with tarfile.open(fileobj=response, mode="r|*") as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    if PurePosixPath(member.name).parts[1:] == (".claude", MANIFEST_FILE):
+                        manifest = json.loads(tar.extractfile(member).read().decode("utf-8"))
+                        if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+                            raise ValueError(f"{MANIFEST_FILE} in the archive is malformed")
+                        if select is not None and (plan is None or manifest["files"] != plan["files"]):
+                            plan = manifest
+                            wanted = select(manifest)
+                        continue
+                    rel = archive_member_path(member.name)
+                    if rel is None:
+                        continue
+                    if wanted is None or rel in wanted:
+                        dest = staging_dir / rel
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        hashes[rel] = extract_member(tar, member, dest)
+                        written.add(rel)
+                    else:
+                        hashes[rel] = hash_member(tar, member)
+        skipped = set() if wanted is None else {rel for rel in wanted if rel in hashes} - written
+        return hashes, manifest, skipped
+
+    try:
+        with TRACER.span("archive", "http", url=archive_url) as span:
+            (hashes, manifest, skipped), span["retries"] = with_retries(lambda: extract(expected))
+            if skipped:
+                # The manifest came after entries it turned out to need
+                span["passes"] = 2
+                (hashes, manifest, skipped), _ = with_retries(lambda: extract(manifest))
+        manifest = manifest or expected
+        if manifest is None:
+            print(f"  Warning: {archive_url} has no {MANIFEST_FILE}; files are installed unverified")
+            manifest = {"version": None, "files": {}}
+            for rel in sorted(hashes):
+                manifest["files"][rel] = {"size": (staging_dir / rel).stat().st_size, "sha256": hashes[rel]}
+            return manifest
+        missing = sorted(rel for rel in manifest["files"] if rel not in hashes)
+        if missing:
+            raise ValueError(f"{len(missing)} file(s) missing from archive, e.g. {missing[0]}")
+        for rel, info in manifest["files"].items():
+            if hashes[rel] != info["sha256"]:
+                raise ValueError(f"{rel} does not match the manifest hash")
+    except (urllib.error.URLError, tarfile.TarError, OSError, ValueError) as e:
+        print(f"  Error: Failed to install from {archive_url}")
         print(f"  {e}")
-        return False
+        return None
+    return manifest
 
 
-def main():
-    """Main bootstrap process."""
-    print_header()
+class RemoteSource:
+    """Workflow files published over HTTP(S), such as raw GitHub content."""
+
+    # Fetched files live in a private staging directory, so clones are safe
+    link_mode = "reflink"
+    files_dir = None
+
+    def __init__(self, base_url: str, archive_url: str, staging_root: Path, jobs: int = DEFAULT_JOBS, cache=None):
+        self.id = base_url.rstrip("/")
+        self.archive_url = archive_url
+        self.staging_root = staging_root
+        self.jobs = jobs
+        self.cache = cache
+
+    def open_staging(self, resumable: bool) -> Path:
+        """
+        Create a staging directory private to this run.
+
+        Partial downloads left by a failed run are parked as ``resume-*``
+        directories. One is claimed with an atomic rename, so exactly one
+        later run resumes it while concurrent runs start from scratch.
+        Directories of runs that died without parking theirs are removed
+        once they are a day old.
+
+        Args:
+            resumable: Whether to adopt a parked directory if one exists
+        """
+        self.staging_root.mkdir(parents=True, exist_ok=True)
+        for stale in self.staging_root.glob("run-*"):
+            try:
+                if time.time() - stale.stat().st_mtime > STALE_STAGING_SECONDS:
+                    shutil.rmtree(stale, ignore_errors=True)
+            except OSError:
+                pass
+        if resumable:
+            for parked in sorted(self.staging_root.glob("resume-*")):
+                claimed = self.staging_root / f"run-{os.getpid()}-{os.urandom(4).hex()}"
+                try:
+                    os.rename(parked, claimed)
+                except OSError:
+                    continue  # Another run claimed it first
+                os.utime(claimed)
+                return claimed
+        return Path(tempfile.mkdtemp(prefix="run-", dir=self.staging_root))
+
+    def close_staging(self, staging_dir: Path):
+        """Park staging_dir for a later run if it holds resumable partials, otherwise remove it."""
+        if any(staging_dir.rglob("*.part.meta")):
+            try:
+                os.rename(staging_dir, staging_dir.with_name("resume-" + staging_dir.name[len("run-"):]))
+                return
+            except OSError:
+                pass
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def read_version(self):
+        """
+        Fetch the published workflow version from the repository VERSION file.
+
+        Returns:
+            str or None: Version string, or None if it could not be fetched
+        """
+        try:
+            return self._read(f"{self.id}/VERSION").decode("utf-8").strip() or None
+        except (urllib.error.URLError, UnicodeDecodeError):
+            return None
+
+    def read_manifest(self):
+        """
+        Fetch the published .claude manifest.
+
+        It is only used to plan which files to install; the files themselves
+        are verified against the manifest inside the release archive.
+
+        Returns:
+            dict or None: Manifest, or None if it is unavailable
+        """
+        try:
+            manifest = json.loads(self._read(f"{self.id}/.claude/{MANIFEST_FILE}").decode("utf-8"))
+        except urllib.error.URLError as e:
+            print(f"  Warning: Could not fetch {MANIFEST_FILE}: {e}")
+            return None
+        except ValueError:
+            return None
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+            return None
+        return manifest
+
+    @staticmethod
+    def _read(url: str) -> bytes:
+        """Fetch a small file into memory, retrying transient failures."""
+        def fetch():
+            with CONNECTION_POOL.request(url) as response:
+                return response.read()
+        return with_retries(fetch)[0]
+
+    def fetch_files(self, files, staging_dir: Path) -> bool:
+        """Download files (relative to .claude) into staging_dir."""
+        return download_files(
+            [(f"{self.id}/.claude/{rel}", staging_dir / rel) for rel in files],
+            self.jobs, self.cache
+        )
+
+    def fetch_tree(self, staging_dir: Path, expected=None, select=None):
+        """Extract .claude entries from the release archive into staging_dir. See fetch_archive()."""
+        return fetch_archive(self.archive_url, staging_dir, expected, select)
+
+    def close(self):
+        """Persist the download cache."""
+        if self.cache is not None:
+            self.cache.save()
+
+
+class LocalSource:
+    """
+    Workflow files on the local filesystem: a repository checkout, a mirror,
+    or an unpacked bundle. The root holds VERSION and .claude/.
+
+    Files are read in place, so fetching only verifies them, and installs
+    can use reflinks (or hardlinks, if asked for) instead of copies.
+    """
+
+    def __init__(self, root: Path, link_mode: str = "auto", source_id=None, temporary: bool = False):
+        self.root = root
+        self.id = source_id or str(root)
+        self.files_dir = root / ".claude"
+        self.link_mode = link_mode
+        self._temporary = temporary
+
+    def read_version(self):
+        """Return the contents of VERSION, or None if it is missing."""
+        try:
+            return (self.root / "VERSION").read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def read_manifest(self):
+        """Return .claude/MANIFEST.json, or a manifest built from the tree if there is none."""
+        try:
+            manifest = json.loads((self.files_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+            if isinstance(manifest, dict) and isinstance(manifest.get("files"), dict):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return build_manifest(self.files_dir, self.read_version())
+
+    def fetch_files(self, files, staging_dir: Path) -> bool:
+        """Check files (relative to .claude) against the manifest; they are used in place."""
+        manifest = self.read_manifest()["files"]
+        bad = [
+            rel for rel in files
+            if rel not in manifest or not file_matches(self.files_dir / rel, manifest[rel])
+        ]
+        for rel in bad:
+            print(f"  Error: {self.files_dir / rel} is missing or does not match the manifest")
+        return not bad
+
+    def fetch_tree(self, staging_dir: Path, expected=None, select=None):
+        """
+        Verify the manifest entries select() asks for (default: all of them) in place.
+
+        Returns:
+            dict or None: The manifest, or None if any file is missing or modified
+        """
+        manifest = self.read_manifest()
+        wanted = manifest["files"] if select is None else select(manifest)
+        bad = [rel for rel in wanted if not file_matches(self.files_dir / rel, manifest["files"][rel])]
+        for rel in bad:
+            print(f"  Error: {self.files_dir / rel} is missing or does not match the manifest")
+        return None if bad else manifest
+
+    def close(self):
+        """Remove the root if it is a temporary unpacked bundle."""
+        if self._temporary:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+
+def extract_bundle(bundle_path: Path) -> Path:
+    """
+    Unpack a bundle written by --export-bundle into a temporary directory.
+
+    Every file is checked against the bundle's manifest.
+
+    Returns:
+        Path: Directory holding VERSION and .claude/
+
+    Raises:
+        tarfile.TarError: If the bundle is not a readable archive
+        ValueError: If a file does not match the manifest
+        OSError: If the bundle cannot be read or unpacked
+    """
+    root = Path(tempfile.mkdtemp(prefix="iw-bundle-"))
+    try:
+        with tarfile.open(bundle_path, "r:*") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                parts = PurePosixPath(member.name).parts
+                if parts[1:] == ("VERSION",):
+                    dest = root / "VERSION"
+                elif parts[1:] == (".claude", MANIFEST_FILE):
+                    dest = root / ".claude" / MANIFEST_FILE
+                else:
+                    rel = archive_member_path(member.name)
+                    if rel is None:
+                        continue
+                    dest = root / ".claude" / rel
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                extract_member(tar, member, dest)
+
+        manifest_path = root / ".claude" / MANIFEST_FILE
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            for rel, info in manifest["files"].items():
+                if not file_matches(root / ".claude" / rel, info):
+                    raise ValueError(f"{rel} is missing or does not match the bundle manifest")
+    except BaseException:
+        shutil.rmtree(root, ignore_errors=True)
+        raise
+    return root
+
+
+def open_source(spec: str, args):
+    """
+    Create the source described by --source.
+
+    Args:
+        spec: http(s) URL, file:// URL, directory, or bundle file
+        args: Parsed command line arguments
+
+    Returns:
+        RemoteSource or LocalSource
+
+    Raises:
+        OSError, tarfile.TarError, ValueError: If a local source cannot be used
+    """
+    parts = urlsplit(spec)
+    if parts.scheme in ("http", "https"):
+        cache = None
+        if not args.no_cache:
+            cache = DownloadCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+        staging_root = args.cache_dir / "staging" / hashlib.sha256(spec.rstrip("/").encode("utf-8")).hexdigest()[:16]
+        return RemoteSource(spec, args.archive_url, staging_root, args.jobs, cache)
+
+    if parts.scheme == "file":
+        path = Path(urllib.request.url2pathname(parts.path))
+    else:
+        path = Path(spec).expanduser()
+    if path.is_dir():
+        return LocalSource(path.resolve(), args.link_mode)
+    if path.is_file():
+        return LocalSource(
+            extract_bundle(path), args.link_mode,
+            source_id=str(path.resolve()), temporary=True
+        )
+    raise OSError(errno.ENOENT, "No such file or directory", spec)
+
+
+def export_bundle(source, bundle_path: Path) -> int:
+    """
+    Write the full .claude tree of a source to a tar.gz bundle.
+
+    The bundle holds VERSION, .claude/ and a .claude/MANIFEST.json used to
+    verify it on install, under a single top-level directory like a
+    release archive.
+
+    Args:
+        source: Source to export
+        bundle_path: Output file
+
+    Returns:
+        int: Exit code
+    """
+    print(f"Exporting bundle from {source.id}...")
+    staging_dir = source.files_dir or Path(tempfile.mkdtemp(prefix="iw-bootstrap-"))
+    try:
+        fetched = source.fetch_tree(staging_dir)
+        if fetched is None:
+            return 1
+        version = source.read_version()
+        manifest = {
+            "version": version,
+            "files": {rel: fetched["files"][rel] for rel in sorted(fetched["files"])},
+        }
+
+        def add_bytes(tar, name, data):
+            info = tarfile.TarInfo(f"{BUNDLE_PREFIX}/{name}")
+            info.size = len(data)
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+
+        tmp = bundle_path.with_name(f".{bundle_path.name}.tmp")
+        with tarfile.open(tmp, "w:gz") as tar:
+            add_bytes(tar, "VERSION", f"{version or ''}\n".encode("utf-8"))
+            for rel in manifest["files"]:
+                tar.add(str(staging_dir / rel), arcname=f"{BUNDLE_PREFIX}/.claude/{rel}", recursive=False)
+            add_bytes(
+                tar, f".claude/{MANIFEST_FILE}",
+                json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+            )
+        os.replace(tmp, bundle_path)
+    except (OSError, tarfile.TarError) as e:
+        print(f"  Error: Could not write bundle {bundle_path}: {e}")
+        return 1
+    finally:
+        if source.files_dir is None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    print(f"Wrote {bundle_path} ({len(manifest['files'])} files, version {version})")
+    return 0
+
+
+def plan_bootstrap_files(install_dir: Path, remote_version, source_id: str, force: bool = False):
+    """
+    Decide which bootstrap files an installation directory needs.
+
+    Nothing is needed when the recorded version and source match the
+    published VERSION and every installed file still matches its recorded
+    hash.
+
+    Returns:
+        list: Paths relative to .claude that must be (re)installed
+    """
+    state = load_install_state(install_dir)
+    if (not force and remote_version and state.get("version") == remote_version
+            and state.get("source") == source_id):
+        return changed_files(install_dir, state, BOOTSTRAP_FILES)
+    return list(BOOTSTRAP_FILES)
+
+
+def plan_bulk(install_dir: Path, manifest, force: bool = False):
+    """
+    Decide which manifest entries an installation directory needs.
+
+    Returns:
+        list or None: Paths relative to .claude that differ from the
+        manifest, or None if there is no manifest to compare against
+    """
+    if manifest is None:
+        return None
+    return [
+        rel for rel, info in manifest["files"].items()
+        if force or not file_matches(install_dir / rel, info)
+    ]
+
+
+def install_target(install_dir: Path, source, staging_dir: Path, files, version, state_files):
+    """
+    Install fetched files from staging_dir into one installation directory.
+
+    Files are materialized next to their destination using the source's
+    link mode, fsynced, and committed together, so a target is either fully
+    updated or left untouched. Files identical to the installed copy are
+    skipped.
+
+    Args:
+        install_dir: Installation .claude directory
+        source: Source the files came from
+        staging_dir: Directory holding the fetched files
+        files: Paths relative to .claude to install
+        version: Version recorded in the install state
+        state_files: Paths recorded in the install state
+
+    Returns:
+        tuple: (status, error message or None)
+    """
+    dests = []
+    try:
+        with TRACER.span("create_dirs", target=str(install_dir)):
+            for parent in sorted({(install_dir / rel).parent for rel in files}):
+                parent.mkdir(parents=True, exist_ok=True)
+        with TRACER.span("materialize", target=str(install_dir)) as span:
+            for rel in files:
+                staged = staging_dir / rel
+                dest = install_dir / rel
+                # A hardlink to the source always "matches" it, even after an edit
+                if (dest.exists() and not os.path.samefile(dest, staged)
+                        and file_sha256(dest) == file_sha256(staged)):
+                    continue
+                dests.append(dest)
+                method = materialize(staged, staging_path(dest), source.link_mode)
+                if method != "hardlink":
+                    # A hardlink shares the source's already durable bytes
+                    fsync_file(staging_path(dest))
+                TRACER.count(f"materialized_{method}")
+            span["files"] = len(dests)
+        with TRACER.span("commit", target=str(install_dir)):
+            commit_staged(dests)
+    except OSError as e:
+        discard_staged(dests)
+        return STATUS_FAILED, str(e)
+
+    try:
+        save_install_state(install_dir, version, state_files, source.id)
+    except OSError as e:
+        return STATUS_INSTALLED, f"could not record install state: {e}"
+    return (STATUS_INSTALLED if dests else STATUS_CURRENT), None
+
+
+def install_all(install_dirs, args, source):
+    """
+    Install into every target, fetching each needed file only once.
+
+    Each target is checked against the published version or manifest, the
+    union of files any target needs is fetched once (into a staging
+    directory private to this run for remote sources), and the targets are
+    then updated in parallel from it. Partial downloads of a failed run are
+    kept for the next run to resume; see RemoteSource.open_staging().
+
+    Args:
+        install_dirs: Installation .claude directories
+        args: Parsed command line arguments
+        source: RemoteSource or LocalSource to install from
+
+    Returns:
+        tuple: (version or None, [(status, error message or None), ...]
+        in the order of install_dirs)
+    """
+    print()
+    print("Checking installed version...")
+    with TRACER.span("plan", targets=len(install_dirs)):
+        if args.bulk:
+            manifest = source.read_manifest()
+            version = manifest.get("version") if manifest is not None else source.read_version()
+            plans = [plan_bulk(install_dir, manifest, args.force) for install_dir in install_dirs]
+        else:
+            manifest = None
+            version = source.read_version()
+            plans = [
+                plan_bootstrap_files(install_dir, version, source.id, args.force)
+                for install_dir in install_dirs
+            ]
+
+    needed = set()
+    for plan in plans:
+        needed.update(plan or ())
+    if not needed and all(plan is not None for plan in plans):
+        return version, [(STATUS_CURRENT, None)] * len(install_dirs)
+
+    # Archives are streamed in one piece, so only per-file downloads resume
+    staging_dir = source.files_dir or source.open_staging(resumable=not args.bulk)
+    try:
+        with TRACER.span("fetch", files=len(needed), source=source.id):
+            if args.bulk:
+                if manifest is not None:
+                    print(f"Fetching workflow files ({len(needed)} of {len(manifest['files'])} changed)...")
+                else:
+                    print("Fetching workflow files...")
+
+                def select(candidate):
+                    if manifest is not None and candidate["files"] == manifest["files"]:
+                        return needed
+                    needs = set()
+                    for install_dir in install_dirs:
+                        needs.update(plan_bulk(install_dir, candidate, args.force))
+                    return needs
 
-    # Get installation location from user
-    install_dir, install_type = get_installation_choice()
+                fetched_manifest = source.fetch_tree(staging_dir, manifest, select)
+                fetched = state_files = None
+                if fetched_manifest is not None:
+                    if manifest is None or fetched_manifest["files"] != manifest["files"]:
+                        # Plan again against the manifest the fetched files were verified with
+                        version = fetched_manifest.get("version") or version
+                        plans = [
+                            plan_bulk(install_dir, fetched_manifest, args.force)
+                            for install_dir in install_dirs
+                        ]
+                    fetched = state_files = list(fetched_manifest["files"])
+            else:
+                print("Downloading iw-install skill...")
+                fetched = sorted(needed) if source.fetch_files(sorted(needed), staging_dir) else None
+                state_files = BOOTSTRAP_FILES
+        if fetched is None:
+            error = "download failed" if source.files_dir is None else "source files are missing or modified"
+            return version, [(STATUS_FAILED, error)] * len(install_dirs)
 
+        print(f"Installing to {len(install_dirs)} location(s)...")
+        with TRACER.span("install", targets=len(install_dirs)):
+            with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(install_dirs)))) as pool:
+                results = list(pool.map(
+                    lambda item: install_target(
+                        item[0], source, staging_dir, fetched if item[1] is None else item[1],
+                        version, state_files
+                    ),
+                    zip(install_dirs, plans)
+                ))
+    finally:
+        if source.files_dir is None:
+            source.close_staging(staging_dir)
+    return version, results
+
+
+def print_summary(install_dirs, results):
+    """Print one line per target followed by totals."""
+    print()
+    print("=" * 46)
+    print("Bootstrap Summary")
+    print("=" * 46)
+    print()
+    for install_dir, (status, error) in zip(install_dirs, results):
+        mark = "✗" if status == STATUS_FAILED else "✓"
+        line = f"  {mark} {install_dir}: {status}"
+        if error:
+            line += f" ({error})"
+        print(line)
+    failed = sum(1 for status, _ in results if status == STATUS_FAILED)
+    print()
+    print(f"{len(results) - failed} succeeded, {failed} failed")
     print()
-    print("Creating directory structure...")
 
-    # Create directory structure
-    skill_dir = install_dir / "skills" / SKILL_NAME / "scripts"
-    commands_dir = install_dir / "commands"
+
+def main(argv=None):
+    """
+    Main bootstrap process.
+
+    Returns:
+        int: 0 on success, 1 if every target failed, 2 if only some did
+    """
+    args = parse_args(argv)
+
+    if args.write_manifest is not None:
+        return write_manifest(args.write_manifest)
+
+    try:
+        source = open_source(args.source, args)
+    except (OSError, tarfile.TarError, ValueError) as e:
+        print(f"Error: Could not open source {args.source}: {e}")
+        return 1
+
+    TRACER.reset(enabled=args.trace is not None)
+    if args.trace is not None:
+        TRACER.metadata.update(source=source.id, mode="bulk" if args.bulk else "files", jobs=args.jobs)
+
+    try:
+        with TRACER.span("bootstrap"):
+            if args.export_bundle is not None:
+                return export_bundle(source, args.export_bundle)
+            return run_bootstrap(args, source)
+    finally:
+        source.close()
+        if args.trace is not None:
+            try:
+                TRACER.write(Path(args.trace))
+            except OSError as e:
+                print(f"  Warning: Could not write trace {args.trace}: {e}")
+
+
+def run_bootstrap(args, source) -> int:
+    """
+    Install from source into the requested or prompted locations.
+
+    Returns:
+        int: Exit code, see main()
+    """
+    print_header()
 
     try:
-        skill_dir.mkdir(parents=True, exist_ok=True)
-        commands_dir.mkdir(parents=True, exist_ok=True)
+        install_dirs = collect_targets(args)
     except OSError as e:
-        print(f"  Error: Could not create directories: {e}")
+        print(f"Error: Could not read targets file: {e}")
         return 1
 
-    # Download files
-    files_to_download = [
-        (
-            f"{REPO_URL}/.claude/skills/{SKILL_NAME}/SKILL.md",
-            install_dir / "skills" / SKILL_NAME / "SKILL.md"
-        ),
-        (
-            f"{REPO_URL}/.claude/skills/{SKILL_NAME}/scripts/manage_workflow.py",
-            install_dir / "skills" / SKILL_NAME / "scripts" / "manage_workflow.py"
-        ),
-        (
-            f"{REPO_URL}/.claude/commands/iw-install.md",
-            install_dir / "commands" / "iw-install.md"
-        ),
-    ]
+    if install_dirs:
+        install_type = "user" if install_dirs[0] == Path.home() / ".claude" else "project"
+        if len(install_dirs) == 1:
+            print(f"Installing to: {install_dirs[0]}")
+    else:
+        # Get installation location from user
+        choice = get_installation_choice()
+        if choice is None:
+            return 1
+        install_dir, install_type = choice
+        install_dirs = [install_dir]
 
-    print("Downloading iw-install skill...")
+    version, results = install_all(install_dirs, args, source)
 
-    for url, dest in files_to_download:
-        if not download_file(url, dest):
-            print()
-            print("=" * 46)
-            print("Bootstrap Failed!")
-            print("=" * 46)
+    if len(install_dirs) > 1:
+        print_summary(install_dirs, results)
+        failed = sum(1 for status, _ in results if status == STATUS_FAILED)
+        if failed == len(results):
+            return 1
+        return 2 if failed else 0
+
+    install_dir = install_dirs[0]
+    status, error = results[0]
+    if status == STATUS_FAILED:
+        print()
+        print("=" * 46)
+        print("Bootstrap Failed!")
+        print("=" * 46)
+        print()
+        if error:
+            print(f"  Error: {error}")
             print()
+        if source.files_dir is not None:
+            print("Could not install required files. Check:")
+            print(f"  - {source.id} contains VERSION and an unmodified .claude/ tree")
+            print("  - The install location is writable")
+        else:
             print("Could not download required files. Check:")
             print("  - Internet connection is working")
-            print("  - GitHub is accessible")
-            print()
-            return 1
+            if source.id == REPO_URL.rstrip("/"):
+                print("  - GitHub is accessible")
+            else:
+                print(f"  - {source.id} is accessible")
+        print()
+        return 1
+    if error:
+        print(f"  Warning: {error}")
+    if status == STATUS_CURRENT:
+        print()
+        name = "Implementation Workflow" if args.bulk else SKILL_NAME
+        print(f"{name} {version} is already installed and up to date.")
+        print()
+        return 0
 
     print()
     print("=" * 46)
     print("Bootstrap Complete!")
     print("=" * 46)
     print()
+    if args.bulk:
+        print("The Implementation Workflow has been installed to:")
+        print(f"  {install_dir}")
+        print()
+        print("Next steps:")
+        print()
+        print("1. Start or restart Claude Code")
+        print()
+        print("2. Start using the workflow:")
+        print("   /iw-help          - Show workflow guidance")
+        print("   /iw-plan <task>   - Create implementation plan")
+        print()
+        print("For more information, see:")
+        print("  https://github.com/jumppad-labs/iw")
+        print()
+        return 0
+
     print("The iw-install skill has been installed to:")
     print(f"  {install_dir / 'skills' / SKILL_NAME}")
     print()